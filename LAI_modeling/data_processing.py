@@ -1,16 +1,34 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import functools
+import os
+import threading
 from pathlib import Path
 from typing import List
 
 import numpy as np
 import pandas as pd
+import rasterio
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+try:
+    import numexpr as ne
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
 
 from file_processing import (
                              grab_files,
+                             iter_files,
                              ensure_directory_exists,
-                             extract_date_from_filename,
                              extract_date_from_filename_YYYY,
-                             save_data_to_csv,
-                             convert_hdr_to_tif
+                             extract_dates_from_filenames,
+                             save_data_to_parquet,
+                             convert_all_hdr_to_tif
                              )
 from plotting import plot_comparison_of_two_lai_datasets
 from raster_processing import (
@@ -22,19 +40,21 @@ from raster_processing import (
                                save_data_to_raster,
                               )
 
-TEMP_DIR = "Temp"
-OUTPUT_DIR = "Result"
+# Path objects keep the output locations portable between Windows and
+# POSIX systems instead of hard-coding a separator into each string
+TEMP_DIR = Path("Temp")
+OUTPUT_DIR = Path("Result")
 DEFAULT_TEMP_RASTER_NAME = "template_raster.tif"
-DEFAULT_TEMP_LAI_DIR ="temp\\temp_lai_unifited"
-DEFAULT_TEMP_LANDUSE_2 ="temp\\new_landuse_2.tif"
-TEMP_LAI_DIR = "temp\\temp_lai_processing"
+DEFAULT_TEMP_LAI_DIR = Path("temp") / "temp_lai_unifited"
+DEFAULT_TEMP_LANDUSE_2 = Path("temp") / "new_landuse_2.tif"
+TEMP_LAI_DIR = Path("temp") / "temp_lai_processing"
 
 
-DEFAULT_LAI_FILENAME = "stat_lai_2020.csv"
+DEFAULT_LAI_FILENAME = "stat_lai_2020.parquet"
 DEFAULT_LAI_FILENAME_new = "stat_lai_predicted.csv"
 
 DEFAULT_LAI_FILENAME_new_by_class = "stat_lai_new_by_class.csv"
-DEFAULT_PLOT_OUTPUT_DIR = "Result\\plot"
+DEFAULT_PLOT_OUTPUT_DIR = OUTPUT_DIR / "plot"
 CLASS_REPLACEMENT_DICT = {
     611: 610,
     612: 610,
@@ -68,18 +88,33 @@ def calculate_lai_statistic(
         - 'pixel_count' (int):
           Number of pixels belonging to the specified class.
     """
-    mask = (landuse_data == landuse_class)
+    if NUMEXPR_AVAILABLE:
+        # numexpr evaluates the comparison multi-threaded in chunks that
+        # fit the CPU cache instead of one full-raster memory pass
+        mask = ne.evaluate(
+            "landuse_data == landuse_class",
+            local_dict={
+                "landuse_data": landuse_data,
+                "landuse_class": landuse_class,
+            },
+        )
+    else:
+        mask = (landuse_data == landuse_class)
 
-    if np.any(mask):
-        filtered_lai_data = lai_data[mask]
+    filtered_lai_data = lai_data[mask]
 
+    # The size of the filtered data already equals the number of matching
+    # pixels, so no extra full-mask reductions are needed
+    if filtered_lai_data.size > 0:
         mean_lai = np.mean(filtered_lai_data)
-        Q1 = np.percentile(filtered_lai_data, 25)
-        Q2 = np.percentile(filtered_lai_data, 50)
-        Q3 = np.percentile(filtered_lai_data, 75)
+
+        # Compute all three quartiles in a single partition pass instead of
+        # sorting the filtered data once per quartile
+        Q1, Q2, Q3 = np.percentile(filtered_lai_data, (25, 50, 75))
+
         min_val = np.min(filtered_lai_data)
         max_val = np.max(filtered_lai_data)
-        pixel_count = np.sum(mask)
+        pixel_count = filtered_lai_data.size
 
         return {
             'Mean': mean_lai,
@@ -92,6 +127,192 @@ def calculate_lai_statistic(
         }
 
 
+def _order_statistics(values: np.ndarray) -> tuple:
+    """
+    Computes (Min, Q1, Median, Q3, Max) of a 1-D array in one partial sort.
+
+    np.percentile partitions the data on every call; partitioning once on
+    all the required ranks selects the five order statistics in a single
+    O(n) pass while reproducing np.percentile's linear interpolation.
+
+    Parameters:
+    - values (numpy.ndarray): Non-empty 1-D array of LAI values.
+
+    Returns:
+    - tuple: (Min, Q1, Median, Q3, Max) of the input values.
+    """
+    n = values.size
+
+    # Fractional rank of each quartile and the two array positions it
+    # interpolates between (np.percentile's default linear method)
+    positions = (0.25 * (n - 1), 0.5 * (n - 1), 0.75 * (n - 1))
+    lows = [int(position) for position in positions]
+    highs = [min(low + 1, n - 1) for low in lows]
+
+    # One introselect pass places every needed rank at its final position
+    kth = np.unique(np.array([0, n - 1] + lows + highs))
+    part = np.partition(values, kth)
+
+    # NaN partitions to the end, so a NaN maximum means the slice holds
+    # NaN; propagate it to every statistic as np.percentile did, rather
+    # than letting the shifted ranks produce bogus finite quartiles
+    if np.isnan(part[n - 1]):
+        nan = float("nan")
+        return nan, nan, nan, nan, nan
+
+    quartiles = []
+    for position, low, high in zip(positions, lows, highs):
+        fraction = position - low
+        quartiles.append(part[low] + (part[high] - part[low]) * fraction)
+
+    return part[0], quartiles[0], quartiles[1], quartiles[2], part[n - 1]
+
+
+def _calculate_statistics_for_values(filtered_lai_data: np.ndarray) -> tuple:
+    """
+    Calculates LAI statistics for an already filtered set of pixel values.
+
+    Parameters:
+    - filtered_lai_data (numpy.ndarray):
+      1-D array holding the LAI values of one land use class.
+
+    Returns:
+    - tuple: (Mean, Min, Q1, Median, Q3, Max, Pixel_count) in the order of
+      the output DataFrame columns, or None when the array is empty. A plain
+      tuple avoids building a throwaway dict per (file, class) pair.
+    """
+    if filtered_lai_data.size == 0:
+        return None
+
+    mean_lai = np.mean(filtered_lai_data)
+
+    # All five order statistics come from a single partial sort
+    min_val, Q1, Q2, Q3, max_val = _order_statistics(filtered_lai_data)
+
+    return (
+        mean_lai,
+        min_val,
+        Q1,
+        Q2,
+        Q3,
+        max_val,
+        filtered_lai_data.size,
+    )
+
+
+def _group_pixels_by_class(
+        landuse_data: np.ndarray,
+        unique_landuse_classes: np.ndarray
+        ) -> tuple:
+    """
+    Builds the pixel grouping of a land use raster once, so it can be
+    reused for every LAI file sharing that raster.
+
+    Parameters:
+    - landuse_data (numpy.ndarray): Array containing land use class
+      identifiers for each pixel.
+    - unique_landuse_classes (numpy.ndarray): Land use classes to report.
+
+    Returns:
+    - tuple: (order, starts, ends) where `order` lists the positions of
+      the relevant pixels in the flattened raster, sorted by class, and
+      `starts`/`ends` bound the slice of each class in the sorted arrays.
+    """
+    # Class 0 marks background/NODATA and is dropped downstream anyway;
+    # excluding its pixels here keeps them out of the sort and out of
+    # every per-file gather, and 0 is often the largest class by far
+    landuse_flat = landuse_data.ravel()
+    valid_positions = np.flatnonzero(landuse_flat != 0)
+
+    # Sort the remaining pixels by land use class once; a stable sort
+    # keeps the class slices deterministic
+    order = valid_positions[
+        np.argsort(landuse_flat[valid_positions], kind="stable")
+    ]
+    landuse_sorted = landuse_flat[order]
+
+    # Locate the slice boundaries of each class in the sorted arrays
+    starts = np.searchsorted(landuse_sorted, unique_landuse_classes, "left")
+    ends = np.searchsorted(landuse_sorted, unique_landuse_classes, "right")
+
+    return order, starts, ends
+
+
+def _stats_by_class(
+        lai_data: np.ndarray,
+        unique_landuse_classes: np.ndarray,
+        order: np.ndarray,
+        starts: np.ndarray,
+        ends: np.ndarray,
+        out_buffer: np.ndarray = None
+        ) -> list:
+    """
+    Calculates the LAI statistics for every land use class in one pass.
+
+    Instead of re-masking the full raster once per class (O(classes x
+    pixels)), the pixels are gathered through the precomputed grouping from
+    `_group_pixels_by_class` so each class is a contiguous slice.
+
+    Parameters:
+    - lai_data (numpy.ndarray): Array containing LAI values.
+    - unique_landuse_classes (numpy.ndarray): Land use classes to report.
+    - order (numpy.ndarray): Argsort of the flattened land use raster.
+    - starts (numpy.ndarray): Per-class slice starts in the sorted arrays.
+    - ends (numpy.ndarray): Per-class slice ends in the sorted arrays.
+    - out_buffer (numpy.ndarray, optional): Preallocated buffer (same size
+      as `order`, dtype of the LAI data) receiving the gathered LAI values,
+      so repeated calls avoid a raster-sized allocation each.
+
+    Returns:
+    - list: (landuse_class, statistics tuple) pairs, skipping classes
+      without pixels.
+    """
+    if out_buffer is None:
+        lai_sorted = lai_data.ravel()[order]
+    else:
+        lai_sorted = np.take(lai_data.ravel(), order, out=out_buffer)
+
+    # With numba installed, one compiled kernel computes every class in
+    # parallel without per-class Python dispatch
+    if NUMBA_AVAILABLE and len(unique_landuse_classes):
+        stats_matrix = np.empty(
+            (len(unique_landuse_classes), 7), dtype=np.float64
+        )
+        _per_file_stats_kernel(
+            lai_sorted,
+            np.ascontiguousarray(starts, dtype=np.int64),
+            np.ascontiguousarray(ends, dtype=np.int64),
+            stats_matrix,
+        )
+
+        stats_by_class = []
+        for row, landuse_class in enumerate(unique_landuse_classes):
+            if stats_matrix[row, 6] > 0:
+                stats_by_class.append(
+                    (
+                        landuse_class,
+                        (
+                            stats_matrix[row, 0],
+                            stats_matrix[row, 1],
+                            stats_matrix[row, 2],
+                            stats_matrix[row, 3],
+                            stats_matrix[row, 4],
+                            stats_matrix[row, 5],
+                            int(stats_matrix[row, 6]),
+                        ),
+                    )
+                )
+        return stats_by_class
+
+    stats_by_class = []
+    for landuse_class, start, end in zip(unique_landuse_classes, starts, ends):
+        stats = _calculate_statistics_for_values(lai_sorted[start:end])
+        if stats is not None:
+            stats_by_class.append((landuse_class, stats))
+
+    return stats_by_class
+
+
 def process_lai_files_and_extract_data(
     unified_lai_list: List[Path],
     land_use_file_path: str,
@@ -123,73 +344,213 @@ def process_lai_files_and_extract_data(
         - 'Pixel_count' (int): Number of pixels belonging to the specified
           land use class.
     """
-    # Read the land use data from the specified raster file
+    # Read the land use data from the specified raster file; the class
+    # codes fit in int16, which halves the bytes moved by the grouping
+    # passes below (NODATA pixels become class 0, which is skipped anyway)
     landuse = read_raster(Path(land_use_file_path))
-    
-    # Get unique land use classes present in the raster, excluding the class '0'
-    unique_classes_raw = np.unique(landuse)
+    landuse = np.where(np.isfinite(landuse), landuse, 0).astype(np.int16)
+
+    # Get unique land use classes present in the raster, excluding the
+    # class '0'. The codes are small non-negative integers after the
+    # reclassification, so a single O(pixels) counting pass replaces the
+    # sort that np.unique would perform
+    landuse_flat = landuse.ravel()
+    if landuse_flat.size and landuse_flat.min() >= 0:
+        class_counts = np.bincount(landuse_flat)
+        unique_classes_raw = np.nonzero(class_counts)[0]
+    else:
+        unique_classes_raw = np.unique(landuse_flat)
     unique_landuse_classes = unique_classes_raw[unique_classes_raw != 0]
 
-    # Initializade a list to store the extracted statistics for each LAI file
-    data = []
-
-    # Iterate over each LAI file in the provided list
-    for lai_file in unified_lai_list:
-
-        # Extract date information from the LAI file name
-        date = str(extract_date_from_filename(lai_file)) 
-
-        # Read LAI data from the current file
-        lai_data = read_raster(lai_file)
-
-        # Loop through each unique land use class
-        for landuse_class in unique_landuse_classes:
-
-            # Calculate mean LAI and boxplot statistics for the current
-            # land use and elevation class
-            stats = calculate_lai_statistic(
-                lai_data, landuse, landuse_class
-            )
+    # The land use raster never changes between LAI files, so compute the
+    # pixel grouping once and reuse it for every file
+    order, starts, ends = _group_pixels_by_class(
+        landuse, unique_landuse_classes
+    )
 
-            # If valid statistics were returned, add them to the data list
-            if stats is not None:
-                data.append(
-                    [
-                        date,
-                        int(landuse_class),
-                        stats["Mean"],
-                        stats["Min"],
-                        stats["Q1"],
-                        stats["Median"],
-                        stats["Q3"],
-                        stats["Max"],
-                        stats["Pixel_count"]
-                    ]
-                )
+    # Preallocate one typed column per output field instead of growing a
+    # list of Python rows that pandas would have to re-parse; the row count
+    # is bounded by files x classes, the columns are trimmed afterwards
+    n_rows_max = len(unified_lai_list) * len(unique_landuse_classes)
+    date_col = np.empty(n_rows_max, dtype=object)
+    landuse_col = np.empty(n_rows_max, dtype=np.int32)
+    mean_col = np.empty(n_rows_max, dtype=np.float64)
+    min_col = np.empty(n_rows_max, dtype=np.float64)
+    q1_col = np.empty(n_rows_max, dtype=np.float64)
+    median_col = np.empty(n_rows_max, dtype=np.float64)
+    q3_col = np.empty(n_rows_max, dtype=np.float64)
+    max_col = np.empty(n_rows_max, dtype=np.float64)
+    count_col = np.empty(n_rows_max, dtype=np.int64)
+
+    # Extract the dates from all LAI file names up front in one vectorized
+    # batch, keeping the per-file hot path free of filename parsing; the
+    # strftime format matches what str() produced on the datetimes before
+    dates = []
+    if unified_lai_list:
+        dates = extract_dates_from_filenames(unified_lai_list).dt.strftime(
+            "%Y-%m-%d %H:%M:%S"
+        ).tolist()
+
+    # One gather buffer per worker thread, reused across its LAI files so
+    # each file does not allocate a fresh raster-sized sorted array
+    thread_scratch = threading.local()
+
+    def _process_one_file(lai_file: Path, date: str) -> tuple:
+        # Read LAI data from the current file; float32 is ample for LAI
+        # values and halves the bandwidth of the statistics passes
+        lai_data = read_raster(lai_file).astype(np.float32, copy=False)
+
+        out_buffer = getattr(thread_scratch, "buffer", None)
+        if out_buffer is None or out_buffer.size != order.size:
+            out_buffer = np.empty(order.size, dtype=np.float32)
+            thread_scratch.buffer = out_buffer
+
+        # Calculate mean LAI and boxplot statistics for every land use
+        # class in a single grouped pass over the raster
+        return date, _stats_by_class(
+            lai_data, unique_landuse_classes, order, starts, ends,
+            out_buffer=out_buffer,
+        )
 
-    # Create a DataFrame from the collected data with specified columns names
+    # Process the LAI files concurrently: the raster reads release the GIL
+    # inside GDAL, so threads overlap the file I/O with the statistics.
+    # executor.map keeps the results in input order
+    cursor = 0
+    max_workers = max(1, min(len(unified_lai_list), os.cpu_count() or 1))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for date, stats_rows in executor.map(
+            _process_one_file, unified_lai_list, dates
+        ):
+            for landuse_class, stats in stats_rows:
+                date_col[cursor] = date
+                landuse_col[cursor] = int(landuse_class)
+                (
+                    mean_col[cursor],
+                    min_col[cursor],
+                    q1_col[cursor],
+                    median_col[cursor],
+                    q3_col[cursor],
+                    max_col[cursor],
+                    count_col[cursor],
+                ) = stats
+                cursor += 1
+
+    # Create a DataFrame from the typed columns without copying them
     data_frame = pd.DataFrame(
-        data,
-        columns=[
-            "Date",
-            "Landuse",
-            "Mean",
-            "Min",
-            "Q1",
-            "Median",
-            "Q3",
-            "Max",
-            "Pixel_count",
-        ],
+        {
+            "Date": date_col[:cursor],
+            "Landuse": landuse_col[:cursor],
+            "Mean": mean_col[:cursor],
+            "Min": min_col[:cursor],
+            "Q1": q1_col[:cursor],
+            "Median": median_col[:cursor],
+            "Q3": q3_col[:cursor],
+            "Max": max_col[:cursor],
+            "Pixel_count": count_col[:cursor],
+        },
+        copy=False,
     )
 
     return data_frame
 
 
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, cache=True)
+    def _reclassify_kernel(flat_i64, indices, repl_keys, repl_values, out):
+        """
+        Numba kernel computing the reclassified codes for a whole raster.
+
+        Works in parallel over the flattened (1-D) raster, where NaN and
+        non-positive pixels have already been replaced with 0; 1-D
+        index-based iteration lets LLVM vectorize the loop without any
+        2-D stride arithmetic or double bounds checks. The replacement
+        table is passed as two aligned arrays and scanned linearly, as it
+        only holds a handful of entries.
+        """
+        for pixel in prange(flat_i64.size):
+            value = flat_i64[pixel]
+
+            # Count the decimal digits of the pixel value
+            ndigits = 1
+            rest = value // 10
+            while rest > 0:
+                ndigits += 1
+                rest //= 10
+
+            # Assemble the new class code from the requested digits
+            new_value = 0
+            for k in range(indices.shape[0]):
+                idx = indices[k]
+                if idx <= ndigits:
+                    digit = (value // 10 ** (ndigits - idx)) % 10
+                    new_value = new_value * 10 + digit
+
+            # Replace the class if it is listed in the replacement table
+            for k in range(repl_keys.shape[0]):
+                if repl_keys[k] == new_value:
+                    new_value = repl_values[k]
+                    break
+
+            out[pixel] = new_value
+
+    @njit(cache=True)
+    def _per_file_stats_kernel(lai_sorted, starts, ends, out):
+        """
+        Numba kernel computing the per-class LAI statistics of one file.
+
+        Deliberately compiled WITHOUT parallel=True: the kernel is called
+        from ThreadPoolExecutor worker threads (one per LAI file), and
+        numba's parallel runtime deadlocks the interpreter when its
+        kernels are launched from non-main threads. The file-level thread
+        pool already provides the parallelism. Each row of `out` receives
+        (Mean, Min, Q1, Median, Q3, Max, Pixel_count), with the quartiles
+        using np.percentile's linear interpolation.
+        """
+        for c in range(starts.shape[0]):
+            start = starts[c]
+            end = ends[c]
+            n = end - start
+
+            out[c, 6] = n
+            if n <= 0:
+                continue
+
+            # Sorted private copy of the class slice
+            seg = np.sort(lai_sorted[start:end])
+
+            # NaN sorts to the end, so a NaN maximum means the slice
+            # holds NaN; propagate it to every statistic as
+            # np.percentile did, instead of computing quartiles whose
+            # ranks are shifted by the NaN count
+            if np.isnan(seg[n - 1]):
+                for col in range(6):
+                    out[c, col] = np.nan
+                continue
+
+            total = 0.0
+            for k in range(n):
+                total += seg[k]
+            out[c, 0] = total / n
+
+            out[c, 1] = seg[0]
+            for qi in range(3):
+                position = 0.25 * (qi + 1) * (n - 1)
+                low = int(position)
+                high = low + 1
+                if high > n - 1:
+                    high = n - 1
+                fraction = position - low
+                out[c, 2 + qi] = (
+                    seg[low] + (seg[high] - seg[low]) * fraction
+                )
+            out[c, 5] = seg[n - 1]
+
+
 def reclassify_raster_by_digit_indices(
         raster: np.ndarray,
         significant_indices: list[int],
-        class_replacement: dict = None
+        class_replacement_dict: dict = None
         ) -> np.ndarray:
     """
     Reclassify raster based on specific digits defined by their indices,
@@ -205,39 +566,96 @@ def reclassify_raster_by_digit_indices(
         new classes.
 
     Returns:
-    - np.ndarray: The reclassified raster array 
+    - np.ndarray: The reclassified raster array
     """
-    # Initialize a new array for reclassified value
-    reclassified_raster = np.zeros(raster.shape, dtype=int)
-
-    # Loop through each pixel
-    for i in range(raster.shape[0]):
-        for j in range(raster.shape[1]):
-            pixel_value = raster[i, j]
-
-            # Check if the pixel value is a valid number (not NaN)
-            if np.isfinite(pixel_value):
-                pixel_str = str(int(pixel_value))
-                try:
-                    # Select the desired digits based on indices
-                    new_value = ''.join(
-                    pixel_str[idx - 1] for idx in significant_indices if idx <= len(pixel_str)
-                                        )
-                    new_value = int(new_value) if new_value else 0
-                    
-                    # If class replacement is needed, apply the replacement
-                    if class_replacement and new_value in class_replacement:
-                        new_value = class_replacement[new_value]
-                    
-                    reclassified_raster[i, j] = new_value
-                except IndexError:
-                    # If the index is out of range, assign 0
-                    reclassified_raster[i, j] = 0
-            else:
-                # If the value is NaN or invalid, assign 0
-                reclassified_raster[i, j] = 0
-
-    return reclassified_raster
+    # Replace NaN and non-positive values with 0 and switch to integer
+    # arithmetic so the digits can be extracted without string conversion
+    arr = np.where(np.isfinite(raster) & (raster > 0), raster, 0)
+    arr = arr.astype(np.int64)
+
+    # Prepare the digit indices and the replacement table as plain arrays
+    indices = np.asarray(significant_indices, dtype=np.int64)
+    if class_replacement_dict:
+        keys = np.array(sorted(class_replacement_dict), dtype=np.int64)
+        values = np.array(
+            [class_replacement_dict[key] for key in keys], dtype=np.int64
+        )
+    else:
+        keys = np.empty(0, dtype=np.int64)
+        values = np.empty(0, dtype=np.int64)
+
+    # All per-pixel work runs on flat 1-D views so both the kernel and
+    # the ufunc passes avoid 2-D stride arithmetic
+    arr_flat = arr.ravel()
+
+    # Use the compiled parallel kernel when numba is installed; int16 holds
+    # every class code the digit selection can produce and halves the
+    # memory traffic of the downstream masking and grouping passes
+    if NUMBA_AVAILABLE:
+        out_flat = np.zeros(arr_flat.size, dtype=np.int16)
+        _reclassify_kernel(arr_flat, indices, keys, values, out_flat)
+        return out_flat.reshape(raster.shape)
+
+    # Pure NumPy path: a land use raster holds only tens to hundreds of
+    # distinct codes, so compute the digit mapping once per unique code
+    # and apply it to the raster with a single gather
+    unique_codes = np.unique(arr_flat)
+    mapped_codes = _map_class_codes(unique_codes, indices, keys, values)
+    positions = np.searchsorted(unique_codes, arr_flat)
+
+    return mapped_codes[positions].reshape(raster.shape)
+
+
+def _map_class_codes(
+        codes: np.ndarray,
+        indices: np.ndarray,
+        repl_keys: np.ndarray,
+        repl_values: np.ndarray
+        ) -> np.ndarray:
+    """
+    Maps an array of non-negative integer class codes to their reclassified
+    codes via digit extraction and the optional replacement table.
+
+    Parameters:
+    - codes (np.ndarray): int64 array of class codes (typically the unique
+      values of a raster, so only tens to hundreds of entries).
+    - indices (np.ndarray): 1-based digit indices to extract.
+    - repl_keys (np.ndarray): Sorted class codes to replace (may be empty).
+    - repl_values (np.ndarray): Replacement codes aligned with repl_keys.
+
+    Returns:
+    - np.ndarray: int16 array of reclassified codes aligned with `codes`.
+    """
+    # Number of decimal digits of each code (a zero code counts as a
+    # single digit, as it did in the string representation)
+    ndigits = np.floor(np.log10(np.maximum(codes, 1))).astype(np.int64) + 1
+
+    # Assemble the new class codes digit by digit
+    mapped = np.zeros(codes.shape, dtype=np.int64)
+    for idx in indices:
+        # Extract the digit at the given 1-based position (counted from
+        # the most significant digit). The exponent is clamped to zero
+        # because NumPy refuses negative integer powers; codes shorter
+        # than the index are discarded by the guard below anyway
+        digit = (codes // 10 ** np.maximum(ndigits - idx, 0)) % 10
+
+        # Codes with fewer digits than the requested index keep their
+        # current value, as the out-of-range indices were skipped before
+        mapped = np.where(idx <= ndigits, mapped * 10 + digit, mapped)
+
+    # If class replacement is needed, apply the replacement
+    if repl_keys.size:
+        # Locate each code in the sorted keys and replace only the codes
+        # actually present in the dictionary
+        positions = np.minimum(
+            np.searchsorted(repl_keys, mapped), len(repl_keys) - 1
+        )
+        replace_mask = repl_keys[positions] == mapped
+        mapped = np.where(replace_mask, repl_values[positions], mapped)
+
+    # int16 holds every class code the digit selection can produce and
+    # halves the memory traffic of the downstream grouping passes
+    return mapped.astype(np.int16)
 
 
 def reclassify_and_process_lai_statistics(
@@ -267,24 +685,28 @@ def reclassify_and_process_lai_statistics(
     # Extract the year from the vegetation raster filename
     year = extract_date_from_filename_YYYY(Path(raster_with_classes))
 
-    # Read the vegetation raster data
-    vegetation_data = read_raster(raster_with_classes)
+    # Define the output path for the reclassified vegetation raster
+    DEFAULT_REC = str(OUTPUT_DIR / f"landuse_{year}_by_2_classes.tif")
 
-    # Reclassify the vegetation raster based on the second digit of class codes
-    predict_veg_map_rec = reclassify_raster_by_digit_indices(
-        raster=vegetation_data,
-        significant_indices=[1, 2]
-    )
+    # Share one GDAL environment between the read and the save
+    with rasterio.Env(GDAL_CACHEMAX=512):
 
-    # Define the output path for the reclassified vegetation raster
-    DEFAULT_REC = OUTPUT_DIR + "\\landuse_" + str(year) + "_by_2_classes.tif"
+        # Read the vegetation raster data
+        vegetation_data = read_raster(raster_with_classes)
 
-    # Save the reclassified vegetation raster for further processing
-    save_data_to_raster(
-        data=predict_veg_map_rec,
-        reference_raster_path=raster_with_classes,
-        output_path=DEFAULT_REC,
-    )
+        # Reclassify the vegetation raster based on the second digit of
+        # class codes
+        predict_veg_map_rec = reclassify_raster_by_digit_indices(
+            raster=vegetation_data,
+            significant_indices=[1, 2]
+        )
+
+        # Save the reclassified vegetation raster for further processing
+        save_data_to_raster(
+            data=predict_veg_map_rec,
+            reference_raster_path=raster_with_classes,
+            output_path=DEFAULT_REC,
+        )
 
     # Obtain a list of raw LAI files from the specified folder
     predict_files_raw = grab_files(
@@ -293,19 +715,30 @@ def reclassify_and_process_lai_statistics(
     )
     
     # Define the output directory for clipped LAI rasters
-    OUTPUT_DIR_PREDICT = "temp\\cutted_raster_" + str(year)
+    OUTPUT_DIR_PREDICT = str(TEMP_DIR / f"cutted_raster_{year}")
 
     # Ensure the output directory exists
     ensure_directory_exists(OUTPUT_DIR_PREDICT)
     
-    # Clip the LAI rasters by the study area shapefile
-    for raster in predict_files_raw:
-        clip_raster_by_shapefile(
-            file_path=raster,
-            aoi_path=study_area_shapefile,
-            output_folder=OUTPUT_DIR_PREDICT,
+    # Clip the LAI rasters by the study area shapefile; every clip is
+    # independent GDAL work, so fan the files out across processes
+    if predict_files_raw:
+        max_workers = max(
+            1, min(len(predict_files_raw), os.cpu_count() or 1)
         )
-        
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            list(
+                executor.map(
+                    functools.partial(
+                        clip_raster_by_shapefile,
+                        aoi_path=study_area_shapefile,
+                        output_folder=OUTPUT_DIR_PREDICT,
+                    ),
+                    predict_files_raw,
+                )
+            )
+
+
     # Obtain a list of clipped LAI raster files
     predict_files = grab_files(
         directory=Path(OUTPUT_DIR_PREDICT),
@@ -318,13 +751,13 @@ def reclassify_and_process_lai_statistics(
         DEFAULT_REC,
     )
 
-    # Define the output CSV file name for the LAI statistics
-    CSV_STAT_PREDICT = "stat_lai_" + str(year) + ".csv"
+    # Define the output file name for the LAI statistics
+    STAT_PREDICT = f"stat_lai_{year}.parquet"
 
-    # Save the extracted LAI statistics to a CSV file
-    save_data_to_csv(
+    # Save the extracted LAI statistics to a Parquet file
+    save_data_to_parquet(
         dataframe=lai_stat_by_class_and_day,
-        filename=CSV_STAT_PREDICT,
+        filename=STAT_PREDICT,
         results_folder=OUTPUT_DIR,
     )
     
@@ -366,67 +799,86 @@ def process_lai_modeling(
     # Extract the base year from the vegetation map filename
     base_year = extract_date_from_filename_YYYY(Path(vegetation_map_path))
 
-    # Obtain a list of raw LAI files from the specified folder
-    files_in_lai_folder = grab_files(Path(lai_daily_avg_dir))
+    # Obtain a list of raw LAI files from the specified folder; only the
+    # extensionless ENVI binaries are converted, their .hdr headers are
+    # picked up by GDAL automatically
+    files_in_lai_folder = [
+        lai_file
+        for lai_file in iter_files(Path(lai_daily_avg_dir))
+        if lai_file.suffix == ""
+    ]
 
     # Ensure the directory exists
     temp_lai_folder_path = ensure_directory_exists(TEMP_LAI_DIR)
 
-    # Convert raw LAI files from HDR to TIF format
-    converted_tiff_files_paths = [
-        convert_hdr_to_tif(file_lai) for file_lai in files_in_lai_folder
-    ]
+    # Convert raw LAI files from HDR to TIF format in parallel
+    converted_tiff_files_paths = convert_all_hdr_to_tif(
+        files_in_lai_folder, temp_lai_folder_path=TEMP_LAI_DIR
+    )
 
     # Ensure necessary directories exist
     ensure_directory_exists(TEMP_DIR)
     ensure_directory_exists(OUTPUT_DIR)
 
-    # Clip the vegetation raster by the study area shepefile
-    clipped_vegetation_ras_path = clip_raster_by_shapefile( 
-            file_path=vegetation_map_path,
-            aoi_path=study_area_shapefile,
-            output_folder=TEMP_DIR,
-        )
+    # define the output path for the reclassified vegetation raster
+    DEFAULT_TEMP_LANDUSE_123 = str(OUTPUT_DIR / f"landuse_{base_year}.tif")
 
-    # Read the clipped vegetation raster into a numpy array
-    veg_map = read_raster(clipped_vegetation_ras_path)
+    # One GDAL environment for the sequential raster steps: the enlarged
+    # block cache and dataset state survive across the clip, read, save
+    # and template opens instead of being torn down per call
+    with rasterio.Env(GDAL_CACHEMAX=512):
 
-    # Reclassify the vegetation raster based on significant indices of class
-    veg_map_rec = reclassify_raster_by_digit_indices(
-        raster=veg_map,
-        significant_indices=[1, 2, 3],
-        class_replacement_dict = CLASS_REPLACEMENT_DICT
-    )
-    
-    # define the output path for the reclassified vegetation raster
-    DEFAULT_TEMP_LANDUSE_123 = "result\\landuse_" + str(base_year) + ".tif"
+        # Clip the vegetation raster by the study area shepefile
+        clipped_vegetation_ras_path = clip_raster_by_shapefile(
+                file_path=vegetation_map_path,
+                aoi_path=study_area_shapefile,
+                output_folder=TEMP_DIR,
+            )
 
-    # Save the reclassified vegetation raster
-    save_data_to_raster(
-        data=veg_map_rec,
-        reference_raster_path=vegetation_map_path,
-        output_path=DEFAULT_TEMP_LANDUSE_123,
-    )
-        
-    # Create a tamplate raster based on the reclassified vegetation raster
-    temp_raster = create_template_raster(
-        base_raster=Path(DEFAULT_TEMP_LANDUSE_123),
-        output_folder=TEMP_DIR,
-        filename=DEFAULT_TEMP_RASTER_NAME
+        # Read the clipped vegetation raster into a numpy array
+        veg_map = read_raster(clipped_vegetation_ras_path)
+
+        # Reclassify the vegetation raster based on significant indices
+        veg_map_rec = reclassify_raster_by_digit_indices(
+            raster=veg_map,
+            significant_indices=[1, 2, 3],
+            class_replacement_dict = CLASS_REPLACEMENT_DICT
         )
 
-    # Standardize the LAI rasters by aligning them to the template raster size
-    unified_lai_list = []
-    for tiff_file in converted_tiff_files_paths:
-        unified_lai_list.append(
-            copy_data_to_template(
-                template_raster=temp_raster,
-                source_file=tiff_file,
-                output_folder=DEFAULT_TEMP_LAI_DIR,
-                filename=None,
-                aoi_path=study_area_shapefile,
+        # Save the reclassified vegetation raster
+        save_data_to_raster(
+            data=veg_map_rec,
+            reference_raster_path=vegetation_map_path,
+            output_path=DEFAULT_TEMP_LANDUSE_123,
+        )
+
+        # Create a tamplate raster based on the reclassified vegetation
+        # raster
+        temp_raster = create_template_raster(
+            base_raster=Path(DEFAULT_TEMP_LANDUSE_123),
+            output_folder=TEMP_DIR,
+            filename=DEFAULT_TEMP_RASTER_NAME
             )
+
+    # Standardize the LAI rasters by aligning them to the template raster
+    # size; the per-file warps are independent, so run them in parallel
+    # (executor.map keeps the output paths in input order)
+    unified_lai_list = []
+    if converted_tiff_files_paths:
+        max_workers = max(
+            1, min(len(converted_tiff_files_paths), os.cpu_count() or 1)
         )
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            unified_lai_list = list(
+                executor.map(
+                    functools.partial(
+                        copy_data_to_template,
+                        temp_raster,
+                        output_folder=DEFAULT_TEMP_LAI_DIR,
+                    ),
+                    converted_tiff_files_paths,
+                )
+            )
 
     # Process the LAI files and extract statistics by class and day
     lai_stat_by_class_and_day = process_lai_files_and_extract_data(
@@ -434,27 +886,102 @@ def process_lai_modeling(
         DEFAULT_TEMP_LANDUSE_123,
     )
 
-    # Save the extracted LAI statistics to a CSV file
-    save_data_to_csv(
+    # Save the extracted LAI statistics to a Parquet file
+    save_data_to_parquet(
                     dataframe=lai_stat_by_class_and_day,
                     filename=DEFAULT_LAI_FILENAME,
                     results_folder=OUTPUT_DIR,
                     )
     
-    # Process each predicted vegetation raster
-    for predicted_vegetation_path in files_in_veg_folder:
-        # Extract the year from the predicted vegetation file name
-        predict_year = extract_date_from_filename_YYYY(
-                                                Path(predicted_vegetation_path)
-                                                       )
-
-        # Clip the predicted vegetation raster by the study area shapefile
+    # Process each predicted vegetation raster; the prediction years are
+    # independent, so each runs in its own worker process. The worker
+    # count is halved because every worker holds several full rasters
+    if files_in_veg_folder:
+        max_workers = max(
+            1, min(len(files_in_veg_folder), (os.cpu_count() or 2) // 2)
+        )
+
+        # Each year worker spawns its own day-level pool inside
+        # generate_lai_raster; cap it so outer times inner stays within
+        # the CPU count instead of multiplying to cpu/2 * cpu processes
+        lai_max_workers = max(1, (os.cpu_count() or 2) // max_workers)
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            list(
+                executor.map(
+                    functools.partial(
+                        _process_one_predicted_vegetation,
+                        study_area_shapefile=study_area_shapefile,
+                        reference_raster_path=vegetation_map_path,
+                        base_landuse_path=DEFAULT_TEMP_LANDUSE_123,
+                        lai_stat_by_class_and_day=lai_stat_by_class_and_day,
+                        base_year=base_year,
+                        lai_max_workers=lai_max_workers,
+                    ),
+                    files_in_veg_folder,
+                )
+            )
+
+
+def _process_one_predicted_vegetation(
+    predicted_vegetation_path: Path,
+    study_area_shapefile: str,
+    reference_raster_path: str,
+    base_landuse_path: str,
+    lai_stat_by_class_and_day: pd.DataFrame,
+    base_year: int,
+    lai_max_workers: int | None = None,
+) -> None:
+    """
+    Processes a single predicted vegetation raster: clips it to the study
+    area, reclassifies it and generates the LAI rasters for its year.
+
+    Module-level helper so `process_lai_modeling` can dispatch prediction
+    years to worker processes.
+
+    Parameters:
+    - predicted_vegetation_path (Path):
+      Path to the predicted vegetation raster.
+    - study_area_shapefile (str):
+      Path to the shapefile representing the study area boundary.
+    - reference_raster_path (str):
+      Raster supplying the metadata for the saved reclassified raster.
+    - base_landuse_path (str):
+      Path to the reclassified base-year land use raster.
+    - lai_stat_by_class_and_day (pd.DataFrame):
+      LAI statistics of the base year by class and day.
+    - base_year (int): Year of the base vegetation raster.
+    - lai_max_workers (int, optional): Cap for the day-level worker pool
+      inside generate_lai_raster, sized by the caller so the nested
+      pools stay within the CPU count.
+
+    Returns:
+    - None: The process outputs results to files.
+    """
+    # Extract the year from the predicted vegetation file name
+    predict_year = extract_date_from_filename_YYYY(
+                                            Path(predicted_vegetation_path)
+                                                   )
+
+    # Define the output path for the reclassified predicted raster
+    DEFAULT_TEMP_pred_123 = str(OUTPUT_DIR / f"landuse_{predict_year}.tif")
+
+    # Define the output folder for the generated LAI rasters
+    DEFAULT_OUTPUT_LAI_DIR = str(OUTPUT_DIR / f"generate_lai_{predict_year}")
+    ensure_directory_exists(DEFAULT_OUTPUT_LAI_DIR)
+
+    # One GDAL environment for the whole prediction year, so the block
+    # cache and driver state persist across its raster operations
+    with rasterio.Env(GDAL_CACHEMAX=512):
+
+        # Clip the predicted vegetation raster by the study area
+        # shapefile
         clipped_vegetation_pred_path = clip_raster_by_shapefile(
                 file_path=predicted_vegetation_path,
                 aoi_path=study_area_shapefile,
                 output_folder=TEMP_DIR,
             )
-        
+
         # Read the clipped vegetation raster into a numpy array
         veg_map_perd = read_raster(clipped_vegetation_pred_path)
 
@@ -465,29 +992,23 @@ def process_lai_modeling(
             class_replacement_dict = CLASS_REPLACEMENT_DICT
         )
 
-        # Define the output path for the reclassified predicted raster
-        DEFAULT_TEMP_pred_123 = "result\\landuse_" + str(predict_year) + ".tif"
-
         # Save the reclassified predicted vegetation raster
         save_data_to_raster(
             data=veg_pred_rec,
-            reference_raster_path=vegetation_map_path,
+            reference_raster_path=reference_raster_path,
             output_path=DEFAULT_TEMP_pred_123,
         )
-    
-        # Define the output folder for the generated LAI rasters
-        DEFAULT_OUTPUT_LAI_DIR = "result\\generate_lai_" + str(predict_year)
-        ensure_directory_exists(DEFAULT_OUTPUT_LAI_DIR)
 
-        # Generate the LAI raster for the vegetation based on the statistics
-        lai_new_stat_by_class_and_day = generate_lai_raster(
+        # Generate the LAI raster based on the statistics
+        generate_lai_raster(
                             dataframe=lai_stat_by_class_and_day,
-                            files_vegetation_base=DEFAULT_TEMP_LANDUSE_123,
+                            files_vegetation_base=base_landuse_path,
                             files_vegetation_predict=DEFAULT_TEMP_pred_123,
                             lai_rasters_folder=DEFAULT_TEMP_LAI_DIR,
                             results_folder=DEFAULT_OUTPUT_LAI_DIR,
                             predict_year=predict_year,
-                            base_year=base_year)
+                            base_year=base_year,
+                            max_workers=lai_max_workers)
 
 
 def plot_lai_by_plants(
@@ -554,6 +1075,6 @@ def plot_lai_by_plants(
     plot_comparison_of_two_lai_datasets(
         base_data_frame=base_lai_stat_by_class_and_day,
         predict_data_frame=predict_lai_stat_by_class_and_day,
-        results_folder_png=DEFAULT_PLOT_OUTPUT_DIR,
+        results_folder=DEFAULT_PLOT_OUTPUT_DIR,
         predict_year=predict_year
     )
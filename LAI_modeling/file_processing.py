@@ -1,4 +1,7 @@
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
+import fnmatch
+from functools import lru_cache, partial
 import os
 from pathlib import Path
 from typing import Optional, List
@@ -7,7 +10,16 @@ import pandas as pd
 import numpy as np
 import rasterio
 
-TEMP_LAI_DIR = "temp\\temp_lai_processing"
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Path object keeps the default location portable between Windows and
+# POSIX systems
+TEMP_LAI_DIR = Path("temp") / "temp_lai_processing"
 DEFAULT_HDR_DRIVER = "ENVI"
 
 CYAN = "\u001b[36m"
@@ -15,58 +27,139 @@ RED = "\u001b[31m"
 RESET = "\033[0m"
 
 
-def grab_files(directory: Path, extension: Optional[str] = None) -> List[Path]:
+def _scandir_recursive(path: str):
     """
-    Recursively grabs files from the given directory and returns a list of
-    file paths that match the given extension (if provided).
-    
+    Recursively yields os.DirEntry objects for every file below `path`.
+
+    os.scandir reuses the file type information the operating system
+    already returns with each directory listing, so no extra stat call or
+    Path object is needed per entry. Symbolic links are skipped to avoid
+    cycles and unreadable directories are silently ignored.
+
+    Parameters:
+    - path (str): Path to the directory to walk.
+
+    Yields:
+    - os.DirEntry: One entry per regular file found.
+    """
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_symlink():
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _scandir_recursive(entry.path)
+                elif entry.is_file():
+                    yield entry
+    except PermissionError:
+        pass
+
+
+def iter_files(directory: Path, extension: Optional[str] = None):
+    """
+    Lazily yields file paths below the given directory, optionally filtered
+    by extension.
+
+    Unlike `grab_files` this never materializes the full match list, so a
+    caller that streams through the files one by one keeps memory constant
+    and can start processing the first file before the walk has finished.
+
     Parameters:
     - directory (Path): Path to the directory to search.
     - extension (Optional[str]): Optional file extension filter (e.g., '.txt').
-      If not provided, all files are returned regardless of their extantion.
+      If not provided, every file is yielded regardless of its extension.
 
-    Returns:
-    - List[Path]: List of file paths matching the given criteria.
+    Yields:
+    - Path: One path per matching file.
     """
-    file_paths = []
-
     # Ensure that the directory exists and is a directory
     if not directory.exists() or not directory.is_dir():
         raise ValueError(f"{CYAN}{directory}{RED} is \
                          not a valid directory.{RESET}")
 
-    # Iterate over all files and subdirectories recursively
-    for element in directory.rglob('*'):
-        if element.is_file():
-            if extension:
-                # Filter by file extension if provided
-                if element.suffix.lower() == extension.lower():
-                    file_paths.append(element)
-            elif element.is_file() and element.suffix == "":
-                file_paths.append(element)
+    # Normalize the extension filter once instead of lowercasing the same
+    # constant string for every file in the tree
+    ext = extension.lower() if extension else None
 
-    return file_paths
+    # Iterate over all files recursively; Path objects are only built for
+    # the entries that pass the filter
+    for entry in _scandir_recursive(str(directory)):
+        if ext is None or entry.name.lower().endswith(ext):
+            yield Path(entry.path)
 
 
-def ensure_directory_exists(directory_path: str) -> Path:
+def grab_files(
+    directory: Path,
+    extension: Optional[str] = None,
+    pattern: Optional[str] = None,
+    ) -> List[Path]:
     """
-    Ensure that the specified exists. If not, create it.
+    Recursively grabs files from the given directory and returns a list of
+    file paths that match the given extension or glob pattern (if provided).
 
     Parameters:
-       directory_path (str or Path): The path to the folder to check or create.
+    - directory (Path): Path to the directory to search.
+    - extension (Optional[str]): Optional file extension filter (e.g., '.txt').
+      If not provided, every file is returned regardless of its extension.
+    - pattern (Optional[str]): Optional glob pattern matched against file
+      names (e.g., 'lai_2020*.tif'). Takes precedence over `extension`.
+
+    Returns:
+    - List[Path]: List of file paths matching the given criteria.
+    """
+    if pattern is not None:
+        # Ensure that the directory exists and is a directory
+        if not directory.exists() or not directory.is_dir():
+            raise ValueError(f"{CYAN}{directory}{RED} is \
+                         not a valid directory.{RESET}")
+
+        # fnmatch.filter matches all names of one directory in a single C
+        # call, which beats per-entry Python string checks for globs
+        file_paths = []
+        for root, _, files in os.walk(directory):
+            for name in fnmatch.filter(files, pattern):
+                file_paths.append(Path(root) / name)
+        return file_paths
+
+    return list(iter_files(directory, extension))
+
+
+@lru_cache(maxsize=256)
+def _ensure_directory(directory_path_str: str) -> Path:
+    """
+    Creates the directory (including parents) and caches the result, so
+    repeated calls for the same folder skip the mkdir/stat syscalls.
+
+    Parameters:
+       directory_path_str (str): The path to the folder to check or create.
 
     Returns:
         Path: The Path object of the ensured directory.
     """
-    path = Path(directory_path)
+    path = Path(directory_path_str)
 
-    # Ensure that the directory exists, if not create it
-    if not path.exists():
-        path.mkdir(parents=True, exist_ok=True)
+    # mkdir with exist_ok is idempotent, so no separate exists() check is
+    # needed
+    path.mkdir(parents=True, exist_ok=True)
 
     return path
 
 
+def ensure_directory_exists(directory_path: str) -> Path:
+    """
+    Ensure that the specified exists. If not, create it.
+
+    Parameters:
+       directory_path (str or Path): The path to the folder to check or create.
+
+    Returns:
+        Path: The Path object of the ensured directory.
+    """
+    # Normalize to a hashable string so Path and str arguments share one
+    # cache entry
+    return _ensure_directory(os.fspath(directory_path))
+
+
 def extract_date_from_filename_YYYY(filename: Path) -> int:
     """
     Extracts the year (YYYY) from the fik=lename. The filename is assumed to be
@@ -91,6 +184,18 @@ def extract_date_from_filename_YYYY(filename: Path) -> int:
     return date_int
 
 
+@lru_cache(maxsize=32)
+def _year_start(year: int) -> datetime:
+    """
+    Returns the first day of the given year, cached.
+
+    `extract_date_from_filename` anchors every day-of-year offset on
+    January 1st; within a batch of daily files the year barely changes, so
+    the datetime construction is paid once per year instead of per file.
+    """
+    return datetime(year, 1, 1)
+
+
 def extract_date_from_filename(filename: Path) -> datetime:
     """
     Extract date from a filename assuming the pattern
@@ -116,7 +221,7 @@ def extract_date_from_filename(filename: Path) -> datetime:
         day_of_year = int(date_str[4:7])
 
         # Calculate the date based on the year and day of year
-        date = datetime(year, 1, 1) + timedelta(days=day_of_year - 1)
+        date = _year_start(year) + timedelta(days=day_of_year - 1)
 
     except Exception as err:
         raise ValueError(f"Could not extract a valid date from filename \
@@ -125,6 +230,46 @@ def extract_date_from_filename(filename: Path) -> datetime:
     return date
 
 
+def extract_dates_from_filenames(filenames: List[Path]) -> pd.Series:
+    """
+    Extracts the dates from a batch of filenames in one vectorized pass.
+
+    Vectorized counterpart of `extract_date_from_filename` for filenames
+    following the pattern '<prefix>_<YYYYDDD>...': the seven-digit date
+    codes are pulled out with a single pandas regex pass and converted
+    with one to_datetime call, instead of parsing each file name in a
+    Python loop.
+
+    Parameters:
+        filenames (List[Path]): Path objects whose names contain the date.
+
+    Returns:
+        pd.Series: Dates as datetimes, aligned with the input order.
+
+    Raises:
+        ValueError: If any filename does not contain a valid date code.
+    """
+    stems = pd.Series(
+        [Path(filename).stem for filename in filenames], dtype="object"
+    )
+
+    # Pull the seven-digit YYYYDDD codes out of all stems at once; the
+    # lookahead rejects longer digit runs instead of silently taking
+    # their first seven digits, matching the per-file parser
+    codes = stems.str.extract(r"_(\d{7})(?!\d)", expand=False)
+
+    if codes.isna().any():
+        invalid = stems[codes.isna()].tolist()
+        raise ValueError(f"Could not extract a valid date from filenames: \
+                         {invalid}")
+
+    # Convert year and day-of-year in a single vectorized call
+    years = codes.str.slice(0, 4).astype("int32")
+    days_of_year = codes.str.slice(4, 7).astype("int32")
+
+    return pd.to_datetime(years * 1000 + days_of_year, format="%Y%j")
+
+
 def save_data_to_csv(
     dataframe: pd.DataFrame,
     filename: str,
@@ -160,8 +305,59 @@ def save_data_to_csv(
 
     try:
 
-        # Save the DataFrame to a CSV file
-        dataframe.to_csv(filepath, index=False)
+        # Save the DataFrame to a CSV file; pyarrow serializes the
+        # numeric columns multi-threaded and is several times faster than
+        # pandas' to_csv on the float-heavy statistics tables
+        if PYARROW_AVAILABLE:
+            pa_csv.write_csv(
+                pa.Table.from_pandas(dataframe, preserve_index=False),
+                filepath,
+            )
+        else:
+            dataframe.to_csv(filepath, index=False)
+    except Exception as err:
+        raise IOError(f"An error occurred while saving the file: {err}")
+
+
+def save_data_to_parquet(
+    dataframe: pd.DataFrame,
+    filename: str,
+    results_folder: str,
+    ) -> None:
+    """
+    Save the data from the provided DataFrame to a Parquet file.
+
+    Parquet keeps the columns in their native dtypes and compresses them,
+    so the LAI statistics tables are several times smaller on disk than
+    CSV and both writing and re-reading avoid the float-to-text
+    conversion cost.
+
+    Parameters:
+        dataframe (pd.DataFrame): The DataFrame containing LAI data to be saved
+        filename (str): The name of the Parquet file.
+        results_folder (str): Path to the folder where the Parquet file
+                                        will be saved.
+
+    Returns:
+        None
+
+    Notes:
+        - The function ensures that the specified results folder exists before
+          attempting to save the file
+        - The DataFrame is saved without the index column
+    """
+    # Ensure the results folder exists
+    directory_path = ensure_directory_exists(results_folder)
+
+    # Formulate the full path to the output Parquet file
+    filepath = os.path.join(results_folder, filename)
+
+    try:
+
+        # Save the DataFrame to a Parquet file
+        dataframe.to_parquet(
+            filepath, engine="pyarrow", compression="zstd", index=False
+        )
     except Exception as err:
         raise IOError(f"An error occurred while saving the file: {err}")
 
@@ -192,34 +388,175 @@ def convert_hdr_to_tif(
         - If the specified temporary folder does not exist, it will be created
           before saving the TIFF file.
     """
+    # Make sure the temporary folder exists before opening the output file
+    ensure_directory_exists(temp_lai_folder_path)
+
     try:
-        with rasterio.open(data_file_path, "r", driver=driver) as src:
-            # Read data from HDR file
-            data = src.read(1)
+        # A bigger GDAL block cache keeps neighbouring blocks resident
+        # between window reads, ALL_CPUS enables GDAL's threaded codec,
+        # and sharing=False sidesteps the shared-handle lock when several
+        # worker processes convert files at once
+        with rasterio.Env(
+            GDAL_CACHEMAX=512,
+            GDAL_NUM_THREADS="ALL_CPUS",
+        ), rasterio.open(
+            data_file_path, "r", driver=driver, sharing=False
+        ) as src:
             profile = src.profile
 
-            # Replace values less than 0 with NaN
-            data[data < 0] = np.nan
-
-        # Update profile for saving in GTiff format
-        profile.update(
-                        driver="GTiff",
-                        dtype=rasterio.float32,
-                        count=1,
-                        nodata=np.nan,
-                        compress="lzw"
+            # Update profile for saving in GTiff format. ZSTD with the
+            # floating-point predictor compresses float32 rasters better
+            # and decompresses faster than LZW, and the tiled layout makes
+            # later windowed reads of the temp files cheap
+            profile.update(
+                            driver="GTiff",
+                            dtype=rasterio.float32,
+                            count=1,
+                            nodata=np.nan,
+                            compress="zstd",
+                            zstd_level=1,
+                            predictor=3,
+                            tiled=True,
+                            blockxsize=256,
+                            blockysize=256,
+                        )
+
+            # Formulate path to tif file based on HDR filename in the folder
+            tiff_file_name = data_file_path.stem + ".tif"
+            out_tif_file = Path(temp_lai_folder_path) / tiff_file_name
+
+            # Convert the raster window by window, so only one block is
+            # held in memory at a time instead of the whole array
+            with rasterio.open(out_tif_file, "w", **profile) as dst:
+                for _, window in src.block_windows(1):
+                    # Let GDAL deliver float32 directly, so no astype copy
+                    # is needed before the write
+                    data = src.read(
+                        1, window=window, out_dtype=rasterio.float32
                     )
 
-        # Formulate path to tif file based on HDR filename in the folder
-        tiff_file_name = f"{Path(data_file_path).stem}.tif"
-        out_tif_file = os.path.join(temp_lai_folder_path, tiff_file_name)
+                    # Replace values less than 0 with NaN in place; putmask
+                    # avoids the indexed scatter of a fancy assignment
+                    np.putmask(data, data < 0, np.nan)
 
-        # Save data in TIFF format
-        with rasterio.open(out_tif_file, "w", **profile) as dst:
-            dst.write(data.astype(rasterio.float32), 1)
+                    dst.write(data, 1, window=window)
 
         return out_tif_file
-    
+
     except Exception as err:
         raise RuntimeError(f"Error occurred while converting {data_file_path}\
                            to tif: {err}")
+
+
+def convert_hdr_stack_to_zarr(
+    hdr_files: List[Path],
+    store_path: str,
+    chunks: tuple = (1, 512, 512),
+    driver: str = DEFAULT_HDR_DRIVER,
+    ) -> str:
+    """
+    Convert a stack of HDR rasters into one chunked, compressed Zarr array.
+
+    Alternative storage backend to the per-file GeoTIFFs: a single
+    (time, y, x) store with Blosc/Zstd bit-shuffle compression avoids the
+    per-file open cost and reads far better for time-series access
+    patterns. The rest of the pipeline still consumes GeoTIFFs, so this
+    is an opt-in export rather than a replacement for
+    `convert_all_hdr_to_tif`.
+
+    Parameters:
+       hdr_files (List[Path]): Paths to the HDR format raster files, in
+                time order; all files must share one grid.
+       store_path (str): Path of the Zarr store to create.
+       chunks (tuple, optional): Chunk shape as (time, y, x).
+                Defaults to (1, 512, 512).
+       driver (str, optional): Rasterio driver to open the HDR files.
+                Defaults is 'ENVI'.
+
+    Returns:
+       str: Path to the created Zarr store.
+
+    Notes:
+        - Requires the optional 'zarr' and 'numcodecs' packages.
+        - Negative values are replaced with NaN, as in the TIF conversion.
+    """
+    try:
+        import zarr
+        from numcodecs import Blosc
+    except ImportError as err:
+        raise ImportError(
+            "convert_hdr_stack_to_zarr requires the optional 'zarr' and "
+            "'numcodecs' packages"
+        ) from err
+
+    if not hdr_files:
+        raise ValueError("No HDR files were provided.")
+
+    # Bit-shuffled zstd compresses float32 rasters far better than LZW
+    compressor = Blosc(cname="zstd", clevel=3, shuffle=Blosc.BITSHUFFLE)
+
+    # Size the store from the first raster; the stack shares one grid
+    with rasterio.open(hdr_files[0], "r", driver=driver) as first:
+        height, width = first.height, first.width
+
+    store = zarr.open(
+        store_path,
+        mode="w",
+        shape=(len(hdr_files), height, width),
+        chunks=chunks,
+        dtype="float32",
+        compressor=compressor,
+    )
+
+    # Write one time slice per file; each slice only needs one raster in
+    # memory at a time
+    for index, hdr_file in enumerate(hdr_files):
+        with rasterio.open(hdr_file, "r", driver=driver) as src:
+            data = src.read(1, out_dtype=rasterio.float32)
+
+        np.putmask(data, data < 0, np.nan)
+        store[index] = data
+
+    return store_path
+
+
+def convert_all_hdr_to_tif(
+    data_file_paths: List[Path],
+    temp_lai_folder_path: str = TEMP_LAI_DIR,
+    max_workers: Optional[int] = None,
+    ) -> List[Path]:
+    """
+    Convert a batch of HDR format raster files to TIFF format in parallel.
+
+    Every conversion is an independent read-mask-write job, so the files
+    are farmed out across a process pool; the conversions scale nearly
+    linearly with the core count.
+
+    Parameters:
+       data_file_paths (List[Path]): Paths to the HDR format raster files.
+       temp_lai_folder_path (str, optional): Path to the temporary folder
+                where the TIFF files will be saved.
+                Defaults to 'temp/temp_lai_processing'.
+       max_workers (int, optional): Number of worker processes. Defaults
+                to the smaller of the file count and the CPU count.
+
+    Returns:
+       List[Path]: Paths to the converted TIF files, in input order.
+    """
+    if not data_file_paths:
+        return []
+
+    if max_workers is None:
+        max_workers = min(len(data_file_paths), os.cpu_count() or 1)
+
+    # executor.map keeps the output paths aligned with the input files
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(
+                partial(
+                    convert_hdr_to_tif,
+                    temp_lai_folder_path=temp_lai_folder_path,
+                ),
+                data_file_paths,
+            )
+        )
@@ -1,5 +1,10 @@
+from pathlib import Path
 from typing import List
 
+import matplotlib
+# Non-interactive backend: the module only writes PNGs, so skip the GUI
+# event-loop work entirely
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import pandas as pd
 
@@ -49,64 +54,77 @@ def plot_comparison_of_two_lai_datasets(
         None: This function does not return any value, but it saves a PNG file
             with the comparison plot.
     """
-    landuse_list = predict_data_frame["Landuse"].unique()
-    
-    for landuse_class in landuse_list:
+    # Partition both frames once instead of rescanning the Landuse column
+    # for every class
+    base_groups = dict(list(base_data_frame.groupby("Landuse", sort=False)))
+    predict_groups = dict(
+        list(predict_data_frame.groupby("Landuse", sort=False))
+        )
 
-        predict_data_frame_by_landuse = (
-            predict_data_frame[predict_data_frame["Landuse"] == landuse_class]
-            )
-        base_data_frame_by_landuse = (
-            base_data_frame[base_data_frame["Landuse"] == landuse_class]
-            )
+    # The day count is a per-dataset constant, so compute the tick
+    # positions and their labels once instead of per landuse class
+    base_num_days = base_data_frame["Date"].nunique()
+    base_xticks = list(range(1, base_num_days + 1, 30))
+    base_xlabels = list(map(str, base_xticks))
+
+    predict_num_days = predict_data_frame["Date"].nunique()
+    predict_xticks = list(range(1, predict_num_days + 1, 30))
+    predict_xlabels = list(map(str, predict_xticks))
+
+    # Reuse one figure with two axes across all landuse classes
+    figure, (base_ax, predict_ax) = plt.subplots(1, 2, figsize=(18, 6))
 
-        # Set up the figure size for the plot
-        plt.figure(figsize=(18, 6))
-        plt.suptitle(
+    for landuse_class, predict_data_frame_by_landuse in (
+            predict_groups.items()):
+
+        base_data_frame_by_landuse = base_groups.get(landuse_class)
+        if base_data_frame_by_landuse is None:
+            continue
+
+        base_ax.clear()
+        predict_ax.clear()
+        figure.suptitle(
             f"Comparison of LAI for Land Use Class {landuse_class}:\
                   2020 vs {predict_year}"
         )
 
         # Plot the base dataset
-        plt.subplot(1,2,1)
         plot_single_lai_graph(
             base_data_frame_by_landuse,
             color_scheme=DEFAULT_COLOR_SCHEME["diagram1"],
             label_prefix=landuse_class,
+            ax=base_ax,
         )
-        plt.title("Average LAI by Day in 2020")
+        base_ax.set_title("Average LAI by Day in 2020")
 
-        num_days = len(base_data_frame_by_landuse)
-        xticks = range(1, num_days+1, 30)
-        plt.xticks(xticks, [str(i) for i in xticks])
-        plt.xlabel("Day of Year")
-        plt.ylabel("LAI Value")
-        plt.ylim(0, 7)
-        plt.legend()
+        base_ax.set_xticks(base_xticks, base_xlabels)
+        base_ax.set_xlabel("Day of Year")
+        base_ax.set_ylabel("LAI Value")
+        base_ax.set_ylim(0, 7)
+        base_ax.legend()
 
         # Plot the predict dataset
-        plt.subplot(1,2,2)
         plot_single_lai_graph(
             predict_data_frame_by_landuse,
             color_scheme=DEFAULT_COLOR_SCHEME["diagram2"],
             label_prefix=landuse_class,
+            ax=predict_ax,
         )
-        plt.title(f"Forecasted Average LAI by Day in {predict_year}")
+        predict_ax.set_title(f"Forecasted Average LAI by Day in {predict_year}")
 
-        num_days = len(predict_data_frame_by_landuse)
-        xticks = range(1, num_days+1, 30)
-        plt.xticks(xticks, [str(i) for i in xticks])
-        plt.xlabel("Day of Year")
-        plt.ylabel("LAI Value")
-        plt.ylim(0, 7)
-        plt.legend()
+        predict_ax.set_xticks(predict_xticks, predict_xlabels)
+        predict_ax.set_xlabel("Day of Year")
+        predict_ax.set_ylabel("LAI Value")
+        predict_ax.set_ylim(0, 7)
+        predict_ax.legend()
 
         # Define the path for saving the comparison plot
-        plot_path = results_folder + f"\\lai_comparison_{landuse_class}_.png"
+        plot_path = Path(results_folder) / f"lai_comparison_{landuse_class}_.png"
 
         # Save the plot as a PNG file
-        plt.savefig(plot_path)
-        plt.close()
+        figure.savefig(plot_path)
+
+    plt.close(figure)
 
 
 def plot_single_lai_graph(
@@ -114,6 +132,7 @@ def plot_single_lai_graph(
     color_scheme: dict,
     label_prefix: str = None,
     display_datas: List[str] = DEFAULT_DISPLAY_DATAS,
+    ax: plt.Axes = None,
     ) -> None:
     """
     Plot LAI (Leaf Area Index) data for a specific time period with various 
@@ -129,51 +148,57 @@ def plot_single_lai_graph(
         color_scheme (dict): A dictionary containing color specifications for 
           different plot elements like 'color_q1_q3', 'color_min_max', and 
           'color_median'.
-        display_datas (List[str], optional): A list of statistical measures 
-          (e.g., 'Q1', 'Q3', 'Min', 'Max', 'Median') to display on the plot. 
+        display_datas (List[str], optional): A list of statistical measures
+          (e.g., 'Q1', 'Q3', 'Min', 'Max', 'Median') to display on the plot.
           Defaults to DEFAULT_DISPLAY_DATAS.
+        ax (plt.Axes, optional): Axes to draw on. Defaults to the current
+          pyplot axes.
 
     Returns:
         None: The function generates the plot but does not return any value.
     """
+    if ax is None:
+        ax = plt.gca()
+
+    # Resolve the colors once instead of per measure inside the loop
+    color_q1_q3 = color_scheme["color_q1_q3"]
+    color_min_max = color_scheme["color_min_max"]
+    color_median = color_scheme["color_median"]
+
+    # Line style (color, linewidth) per statistical measure
+    styles = {
+        "Min": (color_min_max, 0.5),
+        "Max": (color_min_max, 0.5),
+        "Median": (color_median, 2),
+    }
+
     # Plot the shaded area between Q1 and Q3 if both are in display_datas
     if "Q1" in display_datas and "Q3" in display_datas:
-        plt.fill_between(
+        ax.fill_between(
             group_data["Date"], #.dt.dayofyear,
             group_data["Q1"],
             group_data["Q3"],
-            color=color_scheme["color_q1_q3"],
+            color=color_q1_q3,
             alpha=0.5,
             label=f"{label_prefix} Q1 - Q3",
         )
 
     # Iterate through each specified statistical measure in display_datas
     for display_data in display_datas:
-        if display_data == "Min" or display_data == "Max":
-            # Plot Min and Max with a specific color and style
-            plt.plot(
-                group_data["Date"], #.dt.dayofyear,
-                group_data[display_data],
-                color=color_scheme["color_min_max"],
-                linestyle="-",
-                linewidth=0.5,
-                label=f"{label_prefix} {display_data}",
-            )
-
-        elif display_data == "Median":
-            # Plot Median with a thicker line and different color
-            plt.plot(
+        if display_data in styles:
+            color, linewidth = styles[display_data]
+            ax.plot(
                 group_data["Date"], #.dt.dayofyear,
                 group_data[display_data],
-                color=color_scheme["color_median"],
+                color=color,
                 linestyle="-",
-                linewidth=2,
+                linewidth=linewidth,
                 label=f"{label_prefix} {display_data}",
             )
 
         elif display_data not in ["Q1", "Q3"]:
             # Plot other specified data measures as usual
-            plt.plot(
+            ax.plot(
                 group_data["Date"], #.dt.dayofyear,
                 group_data[display_data],
                 label=f"{label_prefix} {display_data}",
@@ -1,11 +1,27 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+
 import geopandas as gpd
 import numpy as np
 import os
 import pandas as pd
 from pathlib import Path
 import rasterio
-from rasterio.mask import mask
+from rasterio.features import geometry_mask
 from rasterio.warp import reproject, Resampling
+from rasterio.windows import from_bounds, Window
+
+try:
+    import numexpr as ne
+    NUMEXPR_AVAILABLE = True
+except ImportError:
+    NUMEXPR_AVAILABLE = False
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
 from file_processing import ensure_directory_exists
 
@@ -14,6 +30,14 @@ GREEN = "\u001b[32m"
 CYAN = "\u001b[36m"
 RESET = "\033[0m"
 
+# Quantization of the generated LAI rasters: int16 centi-units
+LAI_SCALE_FACTOR = 0.01
+LAI_NODATA_INT16 = -32768
+
+# Largest class code for which the remap uses a dense lookup table; above
+# this the codes are treated as sparse and compacted via searchsorted
+DENSE_LUT_MAX_CLASS = 10_000
+
 
 def clip_raster_by_shapefile(
     file_path: str,
@@ -54,14 +78,44 @@ def clip_raster_by_shapefile(
             aoi_file = aoi_file.to_crs(raster_crs)
 
         geoms = aoi_file.geometry.values
-        out_image, out_transform = mask(src, geoms, crop=True)
+
+        # Read only the AOI's bounding window instead of the full raster,
+        # so the bytes read scale with the AOI area
+        window = from_bounds(*aoi_file.total_bounds, transform=src.transform)
+        window = window.round_offsets().round_lengths()
+        window = window.intersection(Window(0, 0, src.width, src.height))
+
+        out_image = src.read(window=window)
+        out_transform = src.window_transform(window)
+
+        # Zero out the cells outside the AOI polygons, matching what
+        # mask(crop=True) produced for rasters without a NODATA value
+        outside_aoi = geometry_mask(
+            geoms,
+            out_shape=out_image.shape[1:],
+            transform=out_transform,
+        )
+        out_image[:, outside_aoi] = 0
+
         out_meta = src.meta.copy()
+
+        # Predictor 3 suits floating-point bands, predictor 2 integers
+        predictor = (
+            3
+            if np.issubdtype(np.dtype(out_meta["dtype"]), np.floating)
+            else 2
+        )
+
         out_meta.update(
             {
                 "driver": "GTiff",
                 "height": out_image.shape[1],
                 "width": out_image.shape[2],
                 "transform": out_transform,
+                "compress": "zstd",
+                "zstd_level": 1,
+                "predictor": predictor,
+                "num_threads": "all_cpus",
             }
         )
 
@@ -115,32 +169,36 @@ def create_template_raster(
             # Remove nodata parameter if it exists
             profile.pop("nodata", None)
 
-            # Update profile for saving in GTiff format
+            # Update profile for saving in GTiff format; SPARSE_OK lets
+            # GDAL leave the unwritten blocks implicit
             profile.update(
                         driver="GTiff",
                         dtype=rasterio.float32,
                         count=1,
-                        compress="lzw"
+                        compress="zstd",
+                        zstd_level=1,
+                        predictor=3,
+                        sparse_ok=True,
                         )
 
-            # Create a new TIFF file with all pixels set to 0
-            with rasterio.open(template_raster_path, "w", **profile) as dst:
-                # Create an array filled with zeros
-                zeros_arr = np.zeros((src.height, src.width), dtype=np.float32)
-
-                # Write the zeros array to the output file
-                dst.write(zeros_arr, 1)
+            # Create the TIFF as a sparse file: nothing is written, so no
+            # zero array is allocated and the file occupies almost no
+            # disk space, yet readers transparently see zeros
+            with rasterio.open(template_raster_path, "w", **profile):
+                pass
     except Exception as err:
         raise RuntimeError(f"An error occurred while creating the template\
                              raster: {err}")
     return template_raster_path
 
 
-def copy_data_to_template( ## CNFHF AEYRWSZ
+def copy_data_to_template(
     template_raster: Path,
     source_file: Path,
     output_folder: str,
     filename: str | None = None,
+    num_threads: int | None = None,
+    warp_mem_limit: int = 512,
 ) -> Path:
     """
     Resamples data from source_file to match the extent and resolution of
@@ -155,10 +213,18 @@ def copy_data_to_template( ## CNFHF AEYRWSZ
           be saved.
         filename (str, optional): Name of the output file. If not provided,
           '_unifited' will be appended to the template file's name.
+        num_threads (int, optional): Number of warp threads for the
+          resampling. Defaults to all but one CPU core.
+        warp_mem_limit (int, optional): Memory limit of the warper in MB.
+          Defaults to 512.
 
     Returns:
          Path: Path to the output raster file.
     """
+    # The warp is parallel across output tiles, so it defaults to using
+    # every core but one
+    if num_threads is None:
+        num_threads = max(1, (os.cpu_count() or 2) - 1)
     # Define the Path object for the output folder
     output_folder_path = ensure_directory_exists(output_folder)
 
@@ -185,8 +251,18 @@ def copy_data_to_template( ## CNFHF AEYRWSZ
             src_crs = src.crs
             src_transform = src.transform
 
-            # Create a new raster ('unifited_file') matching the template
-            #  raster ('dst_zeros')
+            # When the source already sits on the template grid the warp
+            # would be an expensive pass-through, so the bands are read
+            # directly instead
+            aligned = (
+                src_crs == dst_crs
+                and src_transform.almost_equals(dst_transform)
+                and src.shape == dst_shape
+            )
+
+            # Resample and merge in memory, then write the result once:
+            # the old write/reread/rewrite sequence crossed the
+            # filesystem three times per band
             with rasterio.open(
                 unifited_file,
                 "w",
@@ -197,58 +273,101 @@ def copy_data_to_template( ## CNFHF AEYRWSZ
                 dtype=src.dtypes[0],
                 crs=dst_crs,
                 transform=dst_transform,
-            ) as data_resampled:
+            ) as dst_out:
 
-                # Resample data using nearest neighbor interpolation
                 for i in range(1, src.count + 1):
-                    reproject(
-                        source=rasterio.band(src, i),
-                        destination=rasterio.band(data_resampled, i),
-                        src_transform=src_transform,
-                        src_crs=src_crs,
-                        dst_transform=dst_transform,
-                        dst_crs=dst_crs,
-                        resampling=Resampling.nearest,
-                    )
+                    if aligned:
+                        # Same grid: a plain read replaces the warp
+                        band_data = src.read(i)
+                    else:
+                        # Resample using nearest neighbor interpolation
+                        # straight into a numpy buffer
+                        band_data = np.zeros(dst_shape, dtype=src.dtypes[0])
+                        reproject(
+                            source=rasterio.band(src, i),
+                            destination=band_data,
+                            src_transform=src_transform,
+                            src_crs=src_crs,
+                            dst_transform=dst_transform,
+                            dst_crs=dst_crs,
+                            resampling=Resampling.nearest,
+                            num_threads=num_threads,
+                            warp_mem_limit=warp_mem_limit,
+                        )
 
-        # Copy resampled data to the output raster
-        with rasterio.open(unifited_file, "r+") as dst_out:
-            with rasterio.open(unifited_file) as data_resampled:
-                for i in range(1, data_resampled.count + 1):
-                    band_data = data_resampled.read(i)
+                    # Copy non-zero values from the resampled band onto
+                    # the template band; copyto applies the predicate
+                    # element-wise in one pass, with no gather or
+                    # scatter temporaries
                     dst_band_data = dst_zeros.read(i)
-
-                    # Copy non-zero values from resampled raster
-                    # to output raster
-                    dst_band_data[band_data != 0] = band_data[band_data != 0]
+                    np.copyto(dst_band_data, band_data,
+                              where=band_data != 0)
                     dst_out.write(dst_band_data, i)
 
     return unifited_file
 
 
-def read_raster(raster_path: Path) -> np.ndarray:
+@lru_cache(maxsize=16)
+def _read_raster_cached(raster_path_str: str, mtime: float) -> np.ndarray:
     """
-    Reads the first band of a raster file and returns it as a numpy array.
-    If the raster contain a NODATA value, it will be replaced with NaN
+    Reads and caches the first band of a raster file.
+
+    The cache key includes the file modification time, so a rewritten
+    raster is re-read. The returned array is marked read-only because it
+    is shared between all callers of `read_raster`.
 
     Parameters:
-        raster_path (Path): The path to the raster file to be read.
+        raster_path_str (str): Resolved path to the raster file.
+        mtime (float): Modification time of the file (cache key only).
 
     Returns:
         numpy.ndarray: The first band of the raster file as a 2D array.
     """
-    with rasterio.open(raster_path) as src:
-        # Read the first band
-        data = src.read(1)
-
+    with rasterio.open(raster_path_str) as src:
         # Retrieve the NODATA value from the raster metadata
         nodata_value = src.nodata
 
         if nodata_value is not None:
-            # Replace NODATA values with NaN
-            data = np.where(data == nodata_value, np.nan, data)
+            # Let GDAL deliver float32 directly so NaN can be patched in
+            # place, instead of np.where allocating a second full-size
+            # array (and promoting to float64)
+            data = src.read(1, out_dtype="float32")
+            data[data == nodata_value] = np.nan
+        else:
+            data = src.read(1)
 
-        return data
+        # Restore physical units for rasters stored as scaled integers
+        scale = src.scales[0] if src.scales else 1.0
+
+    if scale != 1.0:
+        data = data.astype(np.float32, copy=False)
+        data *= np.float32(scale)
+
+    # Freeze the array so one caller cannot corrupt another's view
+    data.setflags(write=False)
+
+    return data
+
+
+def read_raster(raster_path: Path) -> np.ndarray:
+    """
+    Reads the first band of a raster file and returns it as a numpy array.
+    If the raster contain a NODATA value, it will be replaced with NaN
+
+    Repeated reads of the same unchanged file are served from a small
+    in-memory cache, as the land use raster is re-read by several steps of
+    the pipeline. The returned array is read-only; call `.copy()` to get a
+    private writable version.
+
+    Parameters:
+        raster_path (Path): The path to the raster file to be read.
+
+    Returns:
+        numpy.ndarray: The first band of the raster file as a 2D array.
+    """
+    path = Path(raster_path)
+
+    return _read_raster_cached(str(path.resolve()), os.path.getmtime(path))
 
 
 def save_data_to_raster(
@@ -278,8 +397,21 @@ def save_data_to_raster(
         # Copy metadata from the reference raster
         meta = ref_raster.meta.copy()
 
-        # Update metadata for single-band and float32 output
-        meta.update(dtype="float32", count=1)
+        # Update metadata for single-band and float32 output; ZSTD with
+        # the floating-point predictor shrinks the file several-fold over
+        # an uncompressed write and usually speeds it up, since fewer
+        # bytes reach the disk
+        meta.update(
+            dtype="float32",
+            count=1,
+            compress="zstd",
+            zstd_level=1,
+            predictor=3,
+            tiled=True,
+            blockxsize=256,
+            blockysize=256,
+            num_threads="all_cpus",
+        )
         
         # Ensure the data dimensions match the reference raster's dimensions
         if data.shape != (meta['height'], meta['width']):
@@ -291,6 +423,302 @@ reference raster dimensions.")
             dst.write(data.astype("float32"), 1)
 
 
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _remap_lai_kernel(base, predict, lai, lut, out):
+        """
+        Writes the remapped LAI into `out` in one fused parallel pass.
+
+        Rows are split across threads with prange; each pixel either keeps
+        its LAI (classes match) or is scaled by the ratio of the class
+        means looked up in `lut`. No temporaries are allocated.
+        """
+        for i in prange(base.shape[0]):
+            for j in range(base.shape[1]):
+                b = base[i, j]
+                p = predict[i, j]
+                if b == p:
+                    out[i, j] = lai[i, j]
+                else:
+                    out[i, j] = lai[i, j] * (lut[p] / lut[b])
+
+
+def _remap_lai_block(
+    base_block: np.ndarray,
+    predict_block: np.ndarray,
+    lai_block: np.ndarray,
+    mean_lut: np.ndarray,
+) -> np.ndarray:
+    """
+    Remaps one block of LAI values for changed vegetation classes.
+
+    Pixels whose base and predicted classes match keep their LAI; the
+    others are scaled by the ratio of the class means from `mean_lut`.
+    Dispatches to the numba kernel, then numexpr, then plain NumPy.
+
+    Parameters:
+    - base_block (np.ndarray): Base vegetation classes for the block.
+    - predict_block (np.ndarray): Predicted vegetation classes.
+    - lai_block (np.ndarray): LAI values for the block.
+    - mean_lut (np.ndarray): float32 lookup table of class mean LAI,
+      indexed by class code.
+
+    Returns:
+    - np.ndarray: The remapped LAI block as float32.
+    """
+    lai_block = lai_block.astype(np.float32, copy=False)
+
+    if NUMBA_AVAILABLE:
+        # The compiled kernel looks the means up per pixel and writes
+        # straight into the preallocated output, so no gathered mean
+        # arrays or temporaries are ever built
+        out = np.empty(base_block.shape, dtype=np.float32)
+        _remap_lai_kernel(
+            base_block,
+            predict_block,
+            lai_block,
+            mean_lut,
+            out,
+        )
+        return out
+
+    if NUMEXPR_AVAILABLE:
+        # Gather the per-pixel means with fancy indexing
+        mean_base = mean_lut[base_block.astype(np.intp, copy=False)]
+        mean_predict = mean_lut[predict_block.astype(np.intp, copy=False)]
+
+        # numexpr fuses the whole expression into one chunked,
+        # multi-threaded pass, avoiding the full-size temporaries of the
+        # plain NumPy version
+        return ne.evaluate(
+            "where(base == predict, lai, lai * mp / mb)",
+            local_dict={
+                "base": base_block,
+                "predict": predict_block,
+                "lai": lai_block,
+                "mp": mean_predict,
+                "mb": mean_base,
+            },
+        ).astype(np.float32, copy=False)
+
+    # Plain NumPy fallback: gather one float32 scale per pixel and fix
+    # the unchanged pixels to exactly 1 — everything stays float32, so
+    # no intermediate is silently promoted to float64
+    scale = (
+        mean_lut[predict_block.astype(np.intp, copy=False)]
+        / mean_lut[base_block.astype(np.intp, copy=False)]
+    )
+    scale[base_block == predict_block] = np.float32(1.0)
+
+    return lai_block * scale
+
+
+# Per-worker state for the day-level parallel remap, filled by the pool
+# initializer so the vegetation rasters are loaded once per process
+_day_worker_state = {}
+
+
+def _init_generate_lai_worker(
+    files_vegetation_base: str,
+    files_vegetation_predict: str,
+) -> None:
+    """
+    Loads the vegetation rasters into the worker process.
+
+    Runs once per pool worker, so every `_process_day` task reuses the
+    same in-memory arrays instead of re-reading (or unpickling) them.
+
+    Parameters:
+    - files_vegetation_base (str): Path to the base vegetation raster.
+    - files_vegetation_predict (str): Path to the predicted vegetation
+      raster.
+    """
+    # Keep open dataset handles instead of full arrays: every task reads
+    # only the blocks it needs, so worker RSS stays at a few tiles per
+    # raster no matter how large the grid is. The handles live for the
+    # worker's lifetime and are released when the process exits.
+    base_src = rasterio.open(files_vegetation_base)
+    predict_src = rasterio.open(files_vegetation_predict)
+
+    meta = predict_src.meta.copy()
+
+    # The outputs are stored as int16 scaled by 0.01: LAI spans roughly
+    # 0-10, so centi-units keep plenty of precision while halving the
+    # bytes per pixel on disk and in every later read. ZSTD with the
+    # integer predictor shrinks them further at negligible CPU cost.
+    meta.update(
+        dtype="int16",
+        nodata=LAI_NODATA_INT16,
+        compress="zstd",
+        zstd_level=1,
+        predictor=2,
+        num_threads="all_cpus",
+    )
+
+    # The class codes do not change between days, so the code inventory
+    # is computed once per worker, streaming block by block
+    codes = np.empty(0, dtype=np.int64)
+    for src in (base_src, predict_src):
+        for _, window in src.block_windows(1):
+            block = src.read(1, window=window)
+            codes = np.union1d(codes, block.astype(np.int64, copy=False))
+
+    max_class = int(codes.max()) + 1 if codes.size else 1
+
+    _day_worker_state["base_src"] = base_src
+    _day_worker_state["predict_src"] = predict_src
+    _day_worker_state["meta"] = meta
+    _day_worker_state["max_class"] = max_class
+
+    # Sparse codes (e.g. full CORINE codes) would make the dense table
+    # needlessly large, so above the threshold the sorted code inventory
+    # is kept and blocks are compacted into its index space instead
+    _day_worker_state["sparse_codes"] = (
+        codes if max_class > DENSE_LUT_MAX_CLASS else None
+    )
+
+
+def _process_day(
+    day_of_year: int,
+    class_lai_mean: dict,
+    lai_rasters_folder: str,
+    results_folder: str,
+    base_year: str,
+    predict_year: str,
+) -> None:
+    """
+    Generates the remapped LAI raster for one day of the year.
+
+    Relies on `_init_generate_lai_worker` having populated the worker
+    state with the vegetation rasters and output metadata.
+
+    Parameters:
+    - day_of_year (int): Day of the year of the LAI raster to process.
+    - class_lai_mean (dict): Mapping of land use class to mean LAI for
+      this day.
+    - lai_rasters_folder (str): Folder containing the daily LAI rasters.
+    - results_folder (str): Folder where the resulting raster is saved.
+    - base_year (str): Year of the base vegetation raster.
+    - predict_year (str): Year of the predicted vegetation raster.
+    """
+    base_src = _day_worker_state["base_src"]
+    predict_src = _day_worker_state["predict_src"]
+    meta = _day_worker_state["meta"]
+    max_class = _day_worker_state["max_class"]
+    sparse_codes = _day_worker_state["sparse_codes"]
+
+    # Path to the LAI raster for the specific day
+    lai_raster_path = (
+    Path(lai_rasters_folder) / f"lai_{base_year}{day_of_year:03d}.tif"
+        )
+
+    if sparse_codes is None:
+        # Dense lookup table indexed by class code; classes without
+        # statistics keep the neutral mean of 1, matching the old
+        # dict.get(..., 1) default
+        mean_lut = np.ones(max_class, dtype=np.float32)
+        mean_lut[list(class_lai_mean)] = list(class_lai_mean.values())
+    else:
+        # Compact lookup table indexed by the position of each code in
+        # the sorted inventory; the blocks are translated into the same
+        # index space below
+        mean_lut = np.ones(sparse_codes.size, dtype=np.float32)
+        keys = np.fromiter(class_lai_mean.keys(), dtype=np.int64)
+        vals = np.fromiter(class_lai_mean.values(), dtype=np.float32)
+        positions = np.searchsorted(sparse_codes, keys)
+        found = (positions < sparse_codes.size) & (
+            sparse_codes[np.minimum(positions, sparse_codes.size - 1)]
+            == keys
+        )
+        mean_lut[positions[found]] = vals[found]
+
+    # Define the path for the resulting file
+    output_filename = (
+    Path(results_folder) / f"LAI_{predict_year}{day_of_year:03d}.tif"
+    )
+
+    # Stream everything block by block: the daily LAI raster and both
+    # vegetation rasters are read one matching window at a time, so the
+    # working set stays cache-sized and no full grid is ever held
+    with rasterio.open(lai_raster_path) as lai_src, \
+            rasterio.open(output_filename, "w", **meta) as dst:
+        # Record the scale factor so readers can restore physical units
+        dst.scales = (LAI_SCALE_FACTOR,)
+
+        # Vegetation change is usually localized, so most blocks have no
+        # differing pixels at all. Whether a block differs is the same
+        # for every day, so the flag is cached per window across the
+        # worker's tasks: unchanged blocks skip the vegetation reads and
+        # the remap entirely after the first day.
+        window_has_diff = _day_worker_state.setdefault(
+            "window_has_diff", {}
+        )
+
+        for _, window in lai_src.block_windows(1):
+            lai_block = lai_src.read(1, window=window)
+
+            window_key = (
+                window.row_off, window.col_off,
+                window.height, window.width,
+            )
+            has_diff = window_has_diff.get(window_key)
+
+            if has_diff is False:
+                # Classes match everywhere in this block: the LAI passes
+                # through unscaled
+                new_block = lai_block.astype(np.float32, copy=False)
+            else:
+                # Read the matching tile of the vegetation rasters;
+                # int32 delivery keeps the class codes directly usable
+                # as LUT indices
+                base_block = base_src.read(
+                    1, window=window, out_dtype="int32"
+                )
+                predict_block = predict_src.read(
+                    1, window=window, out_dtype="int32"
+                )
+
+                if has_diff is None:
+                    has_diff = bool(
+                        np.any(base_block != predict_block)
+                    )
+                    window_has_diff[window_key] = has_diff
+
+                if has_diff:
+                    if sparse_codes is not None:
+                        # Translate the raw codes into the compact index
+                        # space of the sorted inventory; every raster
+                        # code is in the inventory, so the lookup is
+                        # exact
+                        base_block = np.searchsorted(
+                            sparse_codes, base_block
+                        ).astype(np.int32, copy=False)
+                        predict_block = np.searchsorted(
+                            sparse_codes, predict_block
+                        ).astype(np.int32, copy=False)
+
+                    new_block = _remap_lai_block(
+                        base_block,
+                        predict_block,
+                        lai_block,
+                        mean_lut,
+                    )
+                else:
+                    new_block = lai_block.astype(np.float32, copy=False)
+
+            # Quantize to int16 centi-units; NaN cells become NODATA
+            scaled_block = np.rint(new_block / LAI_SCALE_FACTOR)
+            np.putmask(
+                scaled_block,
+                ~np.isfinite(scaled_block),
+                LAI_NODATA_INT16,
+            )
+            out_block = scaled_block.clip(-32768, 32767).astype(np.int16)
+
+            dst.write(out_block, 1, window=window)
+
+
 def generate_lai_raster(
                         dataframe: pd.DataFrame,
                         files_vegetation_base: str,
@@ -299,6 +727,7 @@ def generate_lai_raster(
                         results_folder: str,
                         predict_year: str,
                         base_year : str,
+                        max_workers: int | None = None,
                         ) -> pd.DataFrame:
     """
     Generates a LAI raster for each day of the year based on the given
@@ -317,75 +746,48 @@ def generate_lai_raster(
     - predict_year (str): The year of the predicted vegetation raster.
     - base_year (str): The base year for which the original vegetation raster
       was created.
+    - max_workers (int, optional): Size of the day-level worker pool.
+      Callers already running inside a process pool should pass a cap so
+      the nested pools do not multiply past the CPU count. Defaults to
+      one worker per core.
 
     Returns:
     - pd.DataFrame: A DataFrame containing the statistics of the new rasters
       created.
     """
-    data = []
-
-    from data_processing import calculate_lai_statistic
-
-    # Open the base vegetation raster
-    with rasterio.open(files_vegetation_base) as base_src:
-        base_data = base_src.read(1)
-
-    # Create a mask based on the base vegetation raster (non-zero values)
-    mask = (base_data != 0)
-
-    # Open the predicted vegetation raster
-    with rasterio.open(files_vegetation_predict) as predict_src:
-        predict_data = predict_src.read(1)
-        meta = predict_src.meta.copy()
-
-        # Iterate through each unique day in the DataFrame
-        for day in dataframe["Date"].unique():
-            # Filter the DataFrame for the current day
-            day_data = dataframe[dataframe["Date"] == day]
-
-            # Convert day to the day of the year
-            day_of_year = pd.Timestamp(day).dayofyear
-
-
-            # Load the LAI raster for the specific day
-            lai_raster_path = (
-            Path(lai_rasters_folder) / f"lai_{base_year}{day_of_year:03d}.tif"
-                )
-
-            with rasterio.open(lai_raster_path) as lai_src:
-                lai_data = lai_src.read(1)
-
-            # Create a mapping of land use classes to the mean LAI value
-            class_lai_mean = dict(zip(day_data["Landuse"], day_data["Mean"]))
+    # Collect the per-day jobs: each is just the day number plus the
+    # small class-to-mean dict, so pickling them to the workers is cheap
+    days_of_year = []
+    class_means_by_day = []
+
+    # One hash partition of the frame instead of a full boolean scan per
+    # unique day
+    for day, day_data in dataframe.groupby("Date", sort=False):
+        # Convert day to the day of the year
+        days_of_year.append(pd.Timestamp(day).dayofyear)
+
+        # Create a mapping of land use classes to the mean LAI value
+        class_means_by_day.append(
+            dict(zip(day_data["Landuse"], day_data["Mean"]))
+        )
 
-            # Generate a new LAI raster
-            new_lai_data = base_data.copy()
-            for i in range(base_data.shape[0]):
-                for j in range(base_data.shape[1]):
-                    base_class = base_data[i, j]
-                    predict_class = predict_data[i, j]
-                    if base_class == predict_class:
-                        new_lai_data[i, j] = lai_data[i, j]
-                    else:
-                        lai_value = lai_data[i, j]
-                        mean_base_class = class_lai_mean.get(base_class, 1)
-                        mean_predict_class = (
-                            class_lai_mean.get(predict_class, 1)
-                            )
-                        new_lai_data[i, j] = (
-                            lai_value * (mean_predict_class / mean_base_class)
-                            )
-
-            # Update the metadata for the resulting raster
-            meta.update(dtype=rasterio.float32)
-
-            # Define the path for the resulting file
-            output_filename = (
-            Path(results_folder) / f"LAI_{predict_year}{day_of_year:03d}.tif"
-            )
+    worker = partial(
+        _process_day,
+        lai_rasters_folder=lai_rasters_folder,
+        results_folder=results_folder,
+        base_year=base_year,
+        predict_year=predict_year,
+    )
+
+    # Every day is independent, so the remaps run across worker
+    # processes; the initializer loads the vegetation rasters once per
+    # worker instead of pickling them with every task
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_generate_lai_worker,
+        initargs=(files_vegetation_base, files_vegetation_predict),
+    ) as executor:
+        # Drain the iterator so worker exceptions surface here
+        list(executor.map(worker, days_of_year, class_means_by_day))
 
-            # Write the new LAI raster
-            with rasterio.open(output_filename, "w", **meta) as dst:
-                dst.write(new_lai_data.astype(rasterio.float32), 1)
-   
     print(f"Растри LAI збережено в: {results_folder}")
@@ -11,6 +11,7 @@ setup(
         'rasterio==1.3.10',
         'geopandas==0.13.2',
         'matplotlib==3.9.1',
+        'pyarrow==16.1.0',
     ],
     entry_point={
         'console_scriots':[